@@ -0,0 +1,41 @@
+"""Numba-compiled kernel for navigation guidance.
+
+Numba is optional: when it is not installed ``choose_direction_code`` is
+``None`` and the navigation module falls back to its NumPy implementation.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # type: ignore[assignment]
+
+
+FORWARD = 0
+LEFT = 1
+RIGHT = 2
+
+
+def _choose(bboxes: np.ndarray, frame_width: int) -> int:
+    """Return FORWARD, LEFT or RIGHT for an ``(N, 4)`` int32 bbox array."""
+
+    left_count = 0
+    for i in range(bboxes.shape[0]):
+        if bboxes[i, 0] + bboxes[i, 2] < frame_width:
+            left_count += 1
+    right_count = bboxes.shape[0] - left_count
+    if left_count > right_count:
+        return RIGHT
+    if right_count > left_count:
+        return LEFT
+    return FORWARD
+
+
+choose_direction_code: Optional[Callable[[np.ndarray, int], int]] = (
+    njit(cache=True)(_choose) if njit is not None else None
+)
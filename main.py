@@ -6,28 +6,60 @@ This script wires together the voice assistant with navigation, object
 
 from __future__ import annotations
 
-from typing import Iterable, List
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import (
+    DefaultDict,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    TypeVar,
+)
 
-from navigation_module import (
+from navigation import (
+    AudioOutput,
+    CameraInput,
+    DedupAudio,
     DummyAudioOutput,
     DummyObstacleDetector,
+    Frame,
     NavigationAssistant,
     Obstacle,
+    warm_up_guidance,
 )
 from object_detection import (
     DetectedObject,
     DummyObjectDetector,
     ObjectDetectionAssistant,
 )
-from reading_module import DummyOcrEngine, ReadingAssistant
+from reading_module import CachingOcrEngine, DummyOcrEngine, ReadingAssistant
 from voice_assistance import Transcriber, VoiceAssistant
 
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
 class DummyCamera:
     """Simple camera stub for demo purposes."""
 
-    def get_frame(self) -> object:
-        return object()
+    def __init__(self) -> None:
+        self._next_id = 0
+
+    def get_frame(self) -> Frame:
+        frame = Frame(id=self._next_id, payload=object())
+        self._next_id += 1
+        return frame
 
 
 class ScriptedTranscriber(Transcriber):
@@ -37,15 +69,243 @@ class ScriptedTranscriber(Transcriber):
         self._transcripts = list(transcripts)
         self._index = 0
 
+    @property
+    def exhausted(self) -> bool:
+        return self._index >= len(self._transcripts)
+
     def listen(self, audio_source: object) -> str:
-        if self._index >= len(self._transcripts):
+        if self.exhausted:
             return ""
         transcript = self._transcripts[self._index]
         self._index += 1
         return transcript
 
 
-def build_navigation_assistant(camera: DummyCamera, audio: DummyAudioOutput) -> NavigationAssistant:
+class StageTimer:
+    """Records per-stage latencies and tracks a moving average for each stage.
+
+    The newest ``history`` samples per stage are kept in nanoseconds, and an
+    exponentially weighted moving average (EWMA) with weight ``alpha`` is
+    updated on every sample. Stages may be timed from several threads.
+    """
+
+    def __init__(self, alpha: float = 0.2, history: int = 256) -> None:
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self._alpha = alpha
+        self._samples: DefaultDict[str, Deque[int]] = defaultdict(
+            lambda: deque(maxlen=history)
+        )
+        self._ewma_ns: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            with self._lock:
+                self._samples[name].append(elapsed)
+                previous = self._ewma_ns.get(name)
+                self._ewma_ns[name] = (
+                    elapsed
+                    if previous is None
+                    else previous + self._alpha * (elapsed - previous)
+                )
+            logger.debug("stage %s took %.3f ms", name, elapsed / 1e6)
+
+    def samples(self, name: str) -> List[int]:
+        with self._lock:
+            return list(self._samples.get(name, ()))
+
+    def ewma(self, name: str) -> Optional[float]:
+        """Return the moving average latency of ``name`` in seconds."""
+
+        with self._lock:
+            ewma_ns = self._ewma_ns.get(name)
+        return None if ewma_ns is None else ewma_ns / 1e9
+
+
+class FrameProcessor(Protocol):
+    """Protocol for assistants that process one camera frame per call."""
+
+    def process_frame(self) -> object:
+        raise NotImplementedError
+
+
+class LatestValueQueue(Generic[T]):
+    """Single-slot queue that keeps only the most recently put item."""
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[T]" = queue.Queue(maxsize=1)
+        self._lock = threading.Lock()
+
+    def put(self, item: T) -> None:
+        with self._lock:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(item)
+
+    def get(self, timeout: Optional[float] = None) -> T:
+        return self._queue.get(timeout=timeout)
+
+
+class PipelineThread(threading.Thread):
+    """Stoppable worker thread that records the exception that ended it.
+
+    Subclasses implement ``_run`` and poll ``_stopped``; blocking waits use
+    ``POLL_INTERVAL`` timeouts so a stop request is always noticed.
+    """
+
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name, daemon=True)
+        self._stopped = threading.Event()
+        self.error: Optional[Exception] = None
+
+    def run(self) -> None:
+        try:
+            self._run()
+        except Exception as exc:
+            self.error = exc
+            logger.exception("%s failed", self.name)
+
+    def _run(self) -> None:
+        raise NotImplementedError
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+
+class FrameGrabber(PipelineThread):
+    """Captures camera frames continuously, keeping only the newest one."""
+
+    def __init__(
+        self,
+        camera: CameraInput,
+        frames: LatestValueQueue[object],
+        interval: float = 1 / 30,
+    ) -> None:
+        super().__init__(name="frame-grabber")
+        self._camera = camera
+        self._frames = frames
+        self._interval = interval
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._frames.put(self._camera.get_frame())
+            self._stopped.wait(self._interval)
+
+
+class CurrentFrameCamera:
+    """Camera that serves the frame a DetectionWorker is currently processing."""
+
+    def __init__(self) -> None:
+        self._frame: object = None
+
+    def set_frame(self, frame: object) -> None:
+        self._frame = frame
+
+    def get_frame(self) -> object:
+        return self._frame
+
+
+class QueuedAudioOutput:
+    """Audio output that hands messages to a SpeechWorker, keeping the newest."""
+
+    def __init__(self, messages: LatestValueQueue[str]) -> None:
+        self._messages = messages
+
+    def speak(self, message: str) -> None:
+        self._messages.put(message)
+
+
+class SpeechWorker(PipelineThread):
+    """Speaks queued messages so slow text-to-speech never blocks detection.
+
+    After a stop request the worker still speaks whatever message is queued
+    and exits once the queue is empty.
+    """
+
+    def __init__(
+        self,
+        audio: AudioOutput,
+        messages: LatestValueQueue[str],
+        timer: StageTimer,
+    ) -> None:
+        super().__init__(name="speech-worker")
+        self._audio = audio
+        self._messages = messages
+        self._timer = timer
+
+    def _run(self) -> None:
+        while True:
+            try:
+                message = self._messages.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                if self._stopped.is_set():
+                    return
+                continue
+            with self._timer.stage("speak"):
+                self._audio.speak(message)
+
+
+class DetectionWorker(PipelineThread):
+    """Runs the assistant for the active voice mode on the newest frames.
+
+    When frame processing averages more than ``frame_budget`` seconds, the
+    next frame is dropped unprocessed.
+    """
+
+    def __init__(
+        self,
+        voice_assistant: VoiceAssistant,
+        assistants: Dict[str, FrameProcessor],
+        frames: LatestValueQueue[object],
+        camera: CurrentFrameCamera,
+        timer: StageTimer,
+        frame_budget: float,
+    ) -> None:
+        super().__init__(name="detection-worker")
+        self._voice_assistant = voice_assistant
+        self._assistants = assistants
+        self._frames = frames
+        self._camera = camera
+        self._timer = timer
+        self._frame_budget = frame_budget
+
+    def _run(self) -> None:
+        skip_next = False
+        while not self._stopped.is_set():
+            if skip_next:
+                # Dropped frames are read straight off the queue so their
+                # wait is not recorded as a frame_wait sample.
+                if self._take_frame() is not None:
+                    skip_next = False
+                continue
+            with self._timer.stage("frame_wait"):
+                frame = self._take_frame()
+            if frame is None:
+                continue
+            self._camera.set_frame(frame)
+            with self._timer.stage("process_frame"):
+                self._assistants[self._voice_assistant.active_mode].process_frame()
+            busy = self._timer.ewma("process_frame")
+            skip_next = busy is not None and busy > self._frame_budget
+
+    def _take_frame(self) -> Optional[object]:
+        try:
+            return self._frames.get(timeout=self.POLL_INTERVAL)
+        except queue.Empty:
+            return None
+
+
+def build_navigation_assistant(camera: CameraInput, audio: AudioOutput) -> NavigationAssistant:
     return NavigationAssistant(
         camera=camera,
         detector=DummyObstacleDetector(
@@ -60,7 +320,7 @@ def build_navigation_assistant(camera: DummyCamera, audio: DummyAudioOutput) ->
 
 
 def build_object_detection_assistant(
-    camera: DummyCamera, audio: DummyAudioOutput
+    camera: CameraInput, audio: AudioOutput
 ) -> ObjectDetectionAssistant:
     return ObjectDetectionAssistant(
         camera=camera,
@@ -74,34 +334,100 @@ def build_object_detection_assistant(
     )
 
 
-def build_reading_assistant(camera: DummyCamera, audio: DummyAudioOutput) -> ReadingAssistant:
+def build_reading_assistant(camera: CameraInput, audio: AudioOutput) -> ReadingAssistant:
     return ReadingAssistant(
         camera=camera,
-        ocr_engine=DummyOcrEngine(text="Welcome to the campus library"),
+        ocr_engine=CachingOcrEngine(DummyOcrEngine(text="Welcome to the campus library")),
         audio=audio,
     )
 
 
-def run_demo(transcripts: Iterable[str]) -> List[str]:
-    scripted_transcripts = list(transcripts)
-    camera = DummyCamera()
-    audio = DummyAudioOutput()
-    voice_assistant = VoiceAssistant(ScriptedTranscriber(scripted_transcripts))
+def build_assistants(camera: CameraInput, audio: AudioOutput) -> Dict[str, FrameProcessor]:
+    # One shared wrapper, so a repeat is only dropped when nothing else was
+    # spoken in between, whichever mode produced it.
+    audio = DedupAudio(audio)
+    return {
+        "navigation": build_navigation_assistant(camera, audio),
+        "object_detection": build_object_detection_assistant(camera, audio),
+        "reading": build_reading_assistant(camera, audio),
+    }
+
+
+def run_demo(
+    transcripts: Iterable[str],
+    threaded: bool = False,
+    command_interval: float = 0.2,
+    frame_budget: float = 1 / 15,
+    timer: Optional[StageTimer] = None,
+    camera: Optional[CameraInput] = None,
+    audio: Optional[DummyAudioOutput] = None,
+) -> List[str]:
+    """Run the scripted demo and return every message that was spoken.
+
+    The demo runs until every scripted transcript has been heard. By default
+    each transcript is followed by a frame of the active mode, which the
+    assistants skip when the camera returns a frame they have already
+    processed. With
+    ``threaded=True`` frame capture, detection and speech run on their own
+    threads connected by single-slot queues, so detection always works on the
+    newest frame and slow speech never holds it up; ``command_interval`` is
+    the pause between scripted commands in that mode. If a worker thread
+    fails, the error is raised once all threads have stopped.
 
-    navigation_assistant = build_navigation_assistant(camera, audio)
-    object_detection_assistant = build_object_detection_assistant(camera, audio)
-    reading_assistant = build_reading_assistant(camera, audio)
+    Stage latencies are recorded in ``timer`` when one is given. In threaded
+    mode, whenever frame processing averages more than ``frame_budget``
+    seconds the next frame is dropped so detection can catch up with the
+    camera. ``camera`` and ``audio`` default to the dummy backends.
+    """
 
-    for _ in range(len(scripted_transcripts)):
-        voice_assistant.listen_and_handle(audio_source=None)
-        mode = voice_assistant.active_mode
-        if mode == "navigation":
-            navigation_assistant.process_frame()
-        elif mode == "object_detection":
-            object_detection_assistant.process_frame()
-        elif mode == "reading":
-            reading_assistant.process_frame()
+    camera = camera or DummyCamera()
+    audio = audio or DummyAudioOutput()
+    transcriber = ScriptedTranscriber(transcripts)
+    voice_assistant = VoiceAssistant(transcriber)
+    timer = timer or StageTimer()
+
+    if not threaded:
+        assistants = build_assistants(camera, audio)
+        while not transcriber.exhausted:
+            with timer.stage("listen"):
+                result = voice_assistant.listen_and_handle(audio_source=None)
+            # Every tick offers the active mode a frame; the assistants'
+            # frame-id check skips the work when the camera has nothing new.
+            with timer.stage("process_frame"):
+                assistants[result.active_mode].process_frame()
+        return audio.messages
+
+    # Compile the guidance kernel now: charged to the first frame, the
+    # one-off cost would push the process_frame average over frame_budget and
+    # shed the frames that follow for no reason.
+    warm_up_guidance()
+    frames: LatestValueQueue[object] = LatestValueQueue()
+    messages: LatestValueQueue[str] = LatestValueQueue()
+    current_frame_camera = CurrentFrameCamera()
+    assistants = build_assistants(current_frame_camera, QueuedAudioOutput(messages))
+    frame_grabber = FrameGrabber(camera, frames)
+    speech_worker = SpeechWorker(audio, messages, timer)
+    detection_worker = DetectionWorker(
+        voice_assistant, assistants, frames, current_frame_camera, timer, frame_budget
+    )
+    # Stopped in this order so detection hands its last result to speech
+    # before speech drains the queue and exits.
+    threads: List[PipelineThread] = [detection_worker, frame_grabber, speech_worker]
+    for thread in threads:
+        thread.start()
+    try:
+        while not transcriber.exhausted:
+            with timer.stage("listen"):
+                voice_assistant.listen_and_handle(audio_source=None)
+            time.sleep(command_interval)
+    finally:
+        for thread in threads:
+            thread.stop()
+            thread.join()
 
+    for thread in threads:
+        if thread.error is not None:
+            raise RuntimeError(f"{thread.name} failed") from thread.error
     return audio.messages
 
 
@@ -6,21 +6,135 @@ forward guidance cues for safe navigation.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Protocol, Sequence
+from typing import (
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import numpy as np
+
+from _guidance_numba import FORWARD, LEFT, RIGHT, choose_direction_code
 
 
 audio_guidance = ("left", "right", "forward")
 
+R = TypeVar("R")
+
+_DIRECTION_BY_CODE = {FORWARD: "forward", LEFT: "left", RIGHT: "right"}
+
+
+@dataclass(frozen=True, slots=True)
+class Frame:
+    """Camera frame tagged with a monotonically increasing identifier."""
+
+    id: int
+    payload: object
+
+
+class FrameResultCache(Generic[R]):
+    """Remembers the result computed for the most recent camera frame.
 
-@dataclass(frozen=True)
+    Frames are matched on their ``id`` attribute; frames without one are
+    never treated as repeats.
+    """
+
+    def __init__(self) -> None:
+        self._frame_id: Optional[int] = None
+        self._result: Optional[R] = None
+
+    def get(self, frame: object) -> Optional[R]:
+        frame_id = getattr(frame, "id", None)
+        if frame_id is not None and frame_id == self._frame_id:
+            return self._result
+        return None
+
+    def put(self, frame: object, result: R) -> R:
+        self._frame_id = getattr(frame, "id", None)
+        self._result = result
+        return result
+
+
+@dataclass(frozen=True, eq=False, slots=True)
 class Obstacle:
-    """Represents a detected obstacle in the camera frame."""
+    """Represents a detected obstacle in the camera frame.
+
+    ``bbox`` accepts any 4-value sequence and is converted to a ``(4,)``
+    int32 array; rows of an ``ObstacleBatch`` are kept as views rather than
+    copied.
+    """
 
-    bbox: Sequence[int]
+    bbox: Union[Sequence[int], np.ndarray]
     label: str
     confidence: float
 
+    def __post_init__(self) -> None:
+        bbox = np.asarray(self.bbox, dtype=np.int32)
+        if bbox.shape != (4,):
+            raise ValueError(f"bbox must have 4 values, got shape {bbox.shape}")
+        object.__setattr__(self, "bbox", bbox)
+
+
+@dataclass(frozen=True, slots=True)
+class ObstacleBatch:
+    """Obstacles detected in one frame, stored as parallel arrays.
+
+    ``bboxes`` is an ``(N, 4)`` int32 array, ``confidences`` an ``(N,)``
+    float32 array and ``labels`` a tuple of ``N`` strings. The arrays are
+    copied and made read-only, so a batch can be shared between frames and
+    results without being modified through either.
+    """
+
+    bboxes: np.ndarray
+    labels: Tuple[str, ...]
+    confidences: np.ndarray
+
+    def __post_init__(self) -> None:
+        bboxes = np.array(self.bboxes, dtype=np.int32)
+        if bboxes.size == 0:
+            bboxes = bboxes.reshape(0, 4)
+        if bboxes.ndim != 2 or bboxes.shape[1] != 4:
+            raise ValueError(f"bboxes must have shape (N, 4), got {bboxes.shape}")
+        confidences = np.array(self.confidences, dtype=np.float32)
+        if confidences.ndim != 1:
+            raise ValueError(f"confidences must have shape (N,), got {confidences.shape}")
+        labels = tuple(self.labels)
+        if not len(bboxes) == len(labels) == len(confidences):
+            raise ValueError("bboxes, labels and confidences must have the same length")
+        bboxes.setflags(write=False)
+        confidences.setflags(write=False)
+        object.__setattr__(self, "bboxes", bboxes)
+        object.__setattr__(self, "labels", labels)
+        object.__setattr__(self, "confidences", confidences)
+
+    @classmethod
+    def from_obstacles(cls, obstacles: Iterable[Obstacle]) -> ObstacleBatch:
+        obstacle_list = list(obstacles)
+        return cls(
+            bboxes=np.array([obstacle.bbox for obstacle in obstacle_list], dtype=np.int32),
+            labels=tuple(obstacle.label for obstacle in obstacle_list),
+            confidences=np.array(
+                [obstacle.confidence for obstacle in obstacle_list], dtype=np.float32
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __iter__(self) -> Iterator[Obstacle]:
+        for bbox, label, confidence in zip(self.bboxes, self.labels, self.confidences):
+            yield Obstacle(bbox=bbox, label=label, confidence=float(confidence))
+
 
 class CameraInput(Protocol):
     """Protocol for camera input providers."""
@@ -32,10 +146,20 @@ class CameraInput(Protocol):
 class ObstacleDetector(Protocol):
     """Protocol for obstacle detection backends."""
 
-    def detect(self, frame: object) -> Iterable[Obstacle]:
+    def detect(self, frame: object) -> ObstacleBatch:
         raise NotImplementedError
 
 
+class DummyObstacleDetector:
+    """Dummy detector that returns a predefined list of obstacles."""
+
+    def __init__(self, obstacles: Optional[Iterable[Obstacle]] = None) -> None:
+        self._obstacles = ObstacleBatch.from_obstacles(obstacles or ())
+
+    def detect(self, frame: object) -> ObstacleBatch:
+        return self._obstacles
+
+
 class AudioOutput(Protocol):
     """Protocol for audio output backends."""
 
@@ -43,12 +167,48 @@ class AudioOutput(Protocol):
         raise NotImplementedError
 
 
-@dataclass
+class DummyAudioOutput:
+    """Audio output that records spoken messages instead of playing them."""
+
+    def __init__(self) -> None:
+        self.messages: List[str] = []
+
+    def speak(self, message: str) -> None:
+        self.messages.append(message)
+
+
+class DedupAudio:
+    """Audio output wrapper that drops a message repeated within a time window."""
+
+    def __init__(
+        self,
+        audio: AudioOutput,
+        dedup_window_s: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if dedup_window_s < 0:
+            raise ValueError("dedup_window_s must not be negative")
+        self._audio = audio
+        self._dedup_window_s = dedup_window_s
+        self._clock = clock
+        self._last_msg: Optional[str] = None
+        self._last_time = 0.0
+
+    def speak(self, message: str) -> None:
+        now = self._clock()
+        if message == self._last_msg and now - self._last_time < self._dedup_window_s:
+            return
+        self._audio.speak(message)
+        self._last_msg = message
+        self._last_time = now
+
+
+@dataclass(slots=True)
 class GuidanceResult:
     """Result of processing a frame for navigation guidance."""
 
     direction: str
-    obstacles: List[Obstacle]
+    obstacles: ObstacleBatch
 
 
 class NavigationAssistant:
@@ -67,54 +227,65 @@ class NavigationAssistant:
         self._detector = detector
         self._audio = audio
         self._frame_width = frame_width
+        self._frame_cache: FrameResultCache[GuidanceResult] = FrameResultCache()
 
     def process_frame(self) -> GuidanceResult:
         frame = self._camera.get_frame()
-        obstacles = list(self._detector.detect(frame))
+        cached = self._frame_cache.get(frame)
+        if cached is not None:
+            return cached
+        obstacles = self._detector.detect(frame)
         direction = self._compute_guidance(obstacles)
         self._audio.speak(direction)
-        return GuidanceResult(direction=direction, obstacles=obstacles)
-
-    def _compute_guidance(self, obstacles: List[Obstacle]) -> str:
-        if not obstacles:
-            return "forward"
-
-        left_count = 0
-        right_count = 0
-        for obstacle in obstacles:
-            center_x = (obstacle.bbox[0] + obstacle.bbox[2]) / 2
-            if center_x < self._frame_width / 2:
-                left_count += 1
-            else:
-                right_count += 1
-
-        if left_count > right_count:
-            return "right"
-        if right_count > left_count:
-            return "left"
-        return "forward"
+        return self._frame_cache.put(
+            frame, GuidanceResult(direction=direction, obstacles=obstacles)
+        )
 
+    def _compute_guidance(self, obstacles: ObstacleBatch) -> str:
+        return _direction_from_bboxes(obstacles.bboxes, self._frame_width)
 
-def choose_direction_from_obstacles(
-    obstacles: Iterable[Obstacle], frame_width: int
-) -> Optional[str]:
-    """Helper to compute guidance without instantiating NavigationAssistant."""
 
-    if frame_width <= 0:
-        raise ValueError("frame_width must be positive")
-    obstacle_list = list(obstacles)
-    if not obstacle_list:
+def _direction_from_bboxes(bboxes: np.ndarray, frame_width: int) -> str:
+    """Steer away from the side of the frame holding more obstacle centers."""
+
+    if choose_direction_code is not None:
+        return _DIRECTION_BY_CODE[choose_direction_code(bboxes, frame_width)]
+    if len(bboxes) == 0:
         return "forward"
-    left_count = 0
-    right_count = 0
-    for obstacle in obstacle_list:
-        center_x = (obstacle.bbox[0] + obstacle.bbox[2]) / 2
-        if center_x < frame_width / 2:
-            left_count += 1
-        else:
-            right_count += 1
+    # center_x < frame_width / 2 is compared as x0 + x2 < frame_width, which
+    # keeps the tally in exact integer math with no float conversion.
+    doubled_centers = np.add(bboxes[:, 0], bboxes[:, 2], dtype=np.int64)
+    left_count = int(np.count_nonzero(np.less(doubled_centers, frame_width)))
+    right_count = len(doubled_centers) - left_count
     if left_count > right_count:
         return "right"
     if right_count > left_count:
         return "left"
     return "forward"
+
+
+def choose_direction_from_obstacles(
+    obstacles: Union[ObstacleBatch, Iterable[Obstacle]], frame_width: int
+) -> Optional[str]:
+    """Helper to compute guidance without instantiating NavigationAssistant."""
+
+    if frame_width <= 0:
+        raise ValueError("frame_width must be positive")
+    if not isinstance(obstacles, ObstacleBatch):
+        obstacles = ObstacleBatch.from_obstacles(obstacles)
+    return _direction_from_bboxes(obstacles.bboxes, frame_width)
+
+
+def warm_up_guidance() -> None:
+    """Compile the Numba guidance kernel before the first frame needs it.
+
+    The first call of the kernel compiles it, or loads it from Numba's disk
+    cache, which takes a noticeable fraction of a second. Calling this up
+    front keeps that one-off cost out of frame timings. Without Numba it does
+    nothing.
+    """
+
+    if choose_direction_code is not None:
+        # An empty batch has the same array type as a detector's batch, so
+        # this compiles the exact specialization used per frame.
+        choose_direction_from_obstacles(ObstacleBatch.from_obstacles(()), frame_width=1)
@@ -8,22 +8,34 @@ object names via the existing AudioOutput protocol.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Protocol, Sequence
+from typing import Iterable, List, Optional, Protocol, Sequence, Union
 
-from navigation_module import AudioOutput
+import numpy as np
+
+from navigation import AudioOutput, FrameResultCache
 
 
 COMMON_OBJECTS = ("chair", "table", "person", "book", "bottle")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class DetectedObject:
-    """Represents a detected object in the camera frame."""
+    """Represents a detected object in the camera frame.
+
+    ``bbox`` accepts any 4-value sequence and is converted to a ``(4,)``
+    int32 array.
+    """
 
     label: str
-    bbox: Sequence[int]
+    bbox: Union[Sequence[int], np.ndarray]
     confidence: float
 
+    def __post_init__(self) -> None:
+        bbox = np.asarray(self.bbox, dtype=np.int32)
+        if bbox.shape != (4,):
+            raise ValueError(f"bbox must have 4 values, got shape {bbox.shape}")
+        object.__setattr__(self, "bbox", bbox)
+
 
 class CameraInput(Protocol):
     """Protocol for camera input providers."""
@@ -46,14 +58,14 @@ class DummyObjectDetector:
         self._objects = list(objects) if objects is not None else []
 
     def detect(self, frame: object) -> Iterable[DetectedObject]:
-        return list(self._objects)
+        return iter(self._objects)
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionResult:
     """Result of processing a frame for object detection."""
 
-    objects: List[DetectedObject]
+    objects: Optional[List[DetectedObject]]
 
 
 class ObjectDetectionAssistant:
@@ -68,16 +80,28 @@ class ObjectDetectionAssistant:
         self._camera = camera
         self._detector = detector
         self._audio = audio
+        self._frame_cache: FrameResultCache[DetectionResult] = FrameResultCache()
 
-    def process_frame(self) -> DetectionResult:
+    def process_frame(self, include_objects: bool = False) -> DetectionResult:
         frame = self._camera.get_frame()
-        objects = list(self._detector.detect(frame))
-        self._announce(objects)
-        return DetectionResult(objects=objects)
-
-    def _announce(self, objects: List[DetectedObject]) -> None:
-        if not objects:
+        cached = self._frame_cache.get(frame)
+        if cached is not None:
+            if include_objects and cached.objects is None:
+                collected = list(self._detector.detect(frame))
+                cached = self._frame_cache.put(frame, DetectionResult(objects=collected))
+            return cached
+        # Detections are streamed into the announcement and only collected
+        # when the caller asks for them.
+        detections = self._detector.detect(frame)
+        objects = list(detections) if include_objects else None
+        self._announce(objects if objects is not None else detections)
+        return self._frame_cache.put(frame, DetectionResult(objects=objects))
+
+    def _announce(self, objects: Iterable[DetectedObject]) -> None:
+        # One utterance per frame: each speak call carries fixed TTS setup
+        # cost, and repeated labels are only named once, in detection order.
+        labels = dict.fromkeys(detected.label for detected in objects)
+        if not labels:
             self._audio.speak("no objects detected")
             return
-        for detected in objects:
-            self._audio.speak(detected.label)
+        self._audio.speak(", ".join(labels))
@@ -7,10 +7,13 @@ protocol.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional, Protocol
 
-from navigation_module import AudioOutput
+import numpy as np
+
+from navigation import AudioOutput, FrameResultCache
 
 
 class CameraInput(Protocol):
@@ -37,7 +40,83 @@ class DummyOcrEngine:
         return self._text
 
 
-@dataclass
+def _block_means(image: np.ndarray, rows: int, cols: int) -> np.ndarray:
+    """Average ``image`` over a ``rows`` x ``cols`` grid of near-equal blocks."""
+
+    row_starts = np.linspace(0, image.shape[0], rows + 1).astype(np.intp)
+    col_starts = np.linspace(0, image.shape[1], cols + 1).astype(np.intp)
+    sums = np.add.reduceat(image, row_starts[:-1], axis=0, dtype=np.float64)
+    sums = np.add.reduceat(sums, col_starts[:-1], axis=1)
+    counts = np.outer(np.diff(row_starts), np.diff(col_starts))
+    if sums.ndim == 3:
+        sums = sums.sum(axis=2)
+        counts = counts * image.shape[2]
+    return sums / counts
+
+
+def frame_dhash(
+    frame: object, hash_size: int = 16, tolerance: float = 8.0
+) -> Optional[bytes]:
+    """Return a difference hash of an image frame, prefixed with its shape.
+
+    The frame (or its ``payload``) must be a 2-D grayscale or 3-D color
+    array of at least ``hash_size + 1`` pixels per side; ``None`` is
+    returned for anything else. The image is averaged over a grid of
+    ``hash_size + 1`` blocks per side, and one bit is recorded per
+    horizontally and per vertically adjacent block pair, so a line of text
+    changes the hash wherever it falls. A bit is only set when the second
+    block is brighter by more than ``tolerance`` (in pixel intensity units),
+    so sensor noise between near-equal blocks of a still page does not flip
+    it. Large frames are subsampled to about 256 pixels per side before
+    averaging; color channels are only averaged on the block grid.
+    """
+
+    image = getattr(frame, "payload", frame)
+    if not isinstance(image, np.ndarray) or image.ndim not in (2, 3):
+        return None
+    grid = hash_size + 1
+    if min(image.shape[0], image.shape[1]) < grid:
+        return None
+    stride = max(1, min(image.shape[0], image.shape[1]) // 256)
+    thumbnail = _block_means(image[::stride, ::stride], grid, grid)
+    bits = np.concatenate(
+        (
+            (thumbnail[:, 1:] - thumbnail[:, :-1] > tolerance).ravel(),
+            (thumbnail[1:, :] - thumbnail[:-1, :] > tolerance).ravel(),
+        )
+    )
+    return np.array(image.shape, dtype=np.int64).tobytes() + np.packbits(bits).tobytes()
+
+
+class CachingOcrEngine:
+    """OCR engine wrapper that reuses text for perceptually identical frames.
+
+    Results are keyed on ``frame_dhash`` and kept in a small LRU cache.
+    Frames that cannot be hashed are always passed through to the engine.
+    """
+
+    def __init__(self, ocr_engine: OcrEngine, maxsize: int = 8) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._ocr_engine = ocr_engine
+        self._maxsize = maxsize
+        self._cache: OrderedDict[bytes, str] = OrderedDict()
+
+    def extract_text(self, frame: object) -> str:
+        key = frame_dhash(frame)
+        if key is None:
+            return self._ocr_engine.extract_text(frame)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        text = self._ocr_engine.extract_text(frame)
+        self._cache[key] = text
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+        return text
+
+
+@dataclass(slots=True)
 class ReadingResult:
     """Result of processing a frame for reading."""
 
@@ -58,12 +137,16 @@ class ReadingAssistant:
         self._ocr_engine = ocr_engine
         self._audio = audio
         self._fallback_message = fallback_message
+        self._frame_cache: FrameResultCache[ReadingResult] = FrameResultCache()
 
     def process_frame(self) -> ReadingResult:
         frame = self._camera.get_frame()
+        cached = self._frame_cache.get(frame)
+        if cached is not None:
+            return cached
         text = self._ocr_engine.extract_text(frame).strip()
         if text:
             self._audio.speak(text)
         elif self._fallback_message:
             self._audio.speak(self._fallback_message)
-        return ReadingResult(text=text)
+        return self._frame_cache.put(frame, ReadingResult(text=text))
@@ -0,0 +1,152 @@
+import time
+
+import pytest
+
+from main import (
+    CurrentFrameCamera,
+    DetectionWorker,
+    DummyCamera,
+    FrameGrabber,
+    LatestValueQueue,
+    ScriptedTranscriber,
+    StageTimer,
+    run_demo,
+)
+from navigation import DummyAudioOutput
+from voice_assistance import VoiceAssistant
+
+COMMANDS = ["switch to navigation", "switch to object detection", "switch to reading"]
+
+
+class SlowAudioOutput(DummyAudioOutput):
+    def speak(self, message: str) -> None:
+        time.sleep(0.3)
+        super().speak(message)
+
+
+class FailingCamera(DummyCamera):
+    def get_frame(self):
+        frame = super().get_frame()
+        if frame.id == 3:
+            raise OSError("camera unplugged")
+        return frame
+
+
+class SlowAssistant:
+    def __init__(self, camera: CurrentFrameCamera, delay: float) -> None:
+        self._camera = camera
+        self._delay = delay
+        self.frame_ids = []
+
+    def process_frame(self) -> None:
+        self.frame_ids.append(self._camera.get_frame().id)
+        time.sleep(self._delay)
+
+
+class CountingFrameQueue(LatestValueQueue):
+    def __init__(self) -> None:
+        super().__init__()
+        self.taken = 0
+
+    def get(self, timeout=None):
+        frame = super().get(timeout=timeout)
+        self.taken += 1
+        return frame
+
+
+def run_detection_worker(frame_budget: float):
+    frames = CountingFrameQueue()
+    camera = CurrentFrameCamera()
+    assistant = SlowAssistant(camera, delay=0.02)
+    worker = DetectionWorker(
+        VoiceAssistant(ScriptedTranscriber([])),
+        {"navigation": assistant},
+        frames,
+        camera,
+        StageTimer(),
+        frame_budget,
+    )
+    grabber = FrameGrabber(DummyCamera(), frames, interval=0.002)
+    for thread in (worker, grabber):
+        thread.start()
+    time.sleep(0.3)
+    for thread in (worker, grabber):
+        thread.stop()
+        thread.join()
+    return frames.taken, assistant.frame_ids
+
+def test_sequential_demo_announces_each_mode():
+    assert run_demo(COMMANDS) == ["forward", "person, book", "Welcome to the campus library"]
+
+
+def test_threaded_demo_ends_in_last_mode():
+    messages = run_demo(COMMANDS, threaded=True, command_interval=0.05)
+
+    assert messages[0] == "forward"
+    assert messages[-1] == "Welcome to the campus library"
+
+
+def test_threaded_shutdown_speaks_pending_message():
+    messages = run_demo(COMMANDS, threaded=True, audio=SlowAudioOutput())
+
+    assert messages[0] == "forward"
+    assert messages[-1] == "Welcome to the campus library"
+
+
+def test_threaded_worker_failure_is_raised_not_hung():
+    start = time.monotonic()
+
+    with pytest.raises(RuntimeError, match="frame-grabber") as excinfo:
+        run_demo(COMMANDS, threaded=True, camera=FailingCamera())
+
+    assert isinstance(excinfo.value.__cause__, OSError)
+    assert time.monotonic() - start < 5
+
+def test_stage_timer_records_samples_and_moving_average():
+    timer = StageTimer(alpha=0.5)
+
+    for _ in range(3):
+        with timer.stage("work"):
+            pass
+
+    assert len(timer.samples("work")) == 3
+    assert timer.ewma("work") >= 0
+    assert timer.ewma("idle") is None
+    assert timer.samples("idle") == []
+
+
+def test_stage_timer_rejects_invalid_alpha():
+    with pytest.raises(ValueError):
+        StageTimer(alpha=0)
+
+
+def test_demo_records_stage_timings():
+    timer = StageTimer()
+
+    run_demo(COMMANDS, timer=timer)
+
+    assert len(timer.samples("listen")) == len(COMMANDS)
+    assert len(timer.samples("process_frame")) == len(COMMANDS)
+
+
+def test_sequential_demo_processes_a_frame_every_tick():
+    timer = StageTimer()
+
+    messages = run_demo(["switch to navigation", "hello", "anything"], timer=timer)
+
+    assert len(timer.samples("listen")) == 3
+    assert len(timer.samples("process_frame")) == 3
+    assert messages == ["forward"]
+
+
+def test_detection_worker_skips_frames_when_over_budget():
+    taken, processed = run_detection_worker(frame_budget=0.005)
+
+    assert len(processed) > 1
+    assert taken >= 2 * len(processed) - 1
+
+
+def test_detection_worker_processes_every_frame_within_budget():
+    taken, processed = run_detection_worker(frame_budget=1.0)
+
+    assert taken == len(processed)
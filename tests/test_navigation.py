@@ -0,0 +1,236 @@
+import numpy as np
+import pytest
+
+import navigation
+from navigation import (
+    DedupAudio,
+    DummyAudioOutput,
+    DummyObstacleDetector,
+    Frame,
+    FrameResultCache,
+    NavigationAssistant,
+    Obstacle,
+    ObstacleBatch,
+    choose_direction_from_obstacles,
+)
+
+
+class StaticCamera:
+    def __init__(self, frame: object) -> None:
+        self.frame = frame
+
+    def get_frame(self) -> object:
+        return self.frame
+
+
+class RecordingAudio:
+    def __init__(self) -> None:
+        self.messages = []
+
+    def speak(self, message: str) -> None:
+        self.messages.append(message)
+
+
+class CountingObstacleDetector:
+    def __init__(self, obstacles) -> None:
+        self.obstacles = list(obstacles)
+        self.calls = 0
+
+    def detect(self, frame: object):
+        self.calls += 1
+        return ObstacleBatch.from_obstacles(self.obstacles)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def speak_at(audio: DedupAudio, clock: FakeClock, message: str, now: float) -> None:
+    clock.now = now
+    audio.speak(message)
+
+
+def make_navigation(camera):
+    detector = CountingObstacleDetector(
+        [Obstacle(bbox=(20, 0, 80, 60), label="chair", confidence=0.9)]
+    )
+    audio = RecordingAudio()
+    assistant = NavigationAssistant(camera=camera, detector=detector, audio=audio, frame_width=320)
+    return assistant, detector, audio
+
+
+def test_navigation_reuses_result_for_repeated_frame():
+    camera = StaticCamera(Frame(id=7, payload=object()))
+    assistant, detector, audio = make_navigation(camera)
+
+    first = assistant.process_frame()
+    second = assistant.process_frame()
+
+    assert second is first
+    assert detector.calls == 1
+    assert audio.messages == ["right"]
+
+    camera.frame = Frame(id=8, payload=object())
+    assistant.process_frame()
+
+    assert detector.calls == 2
+
+
+def test_navigation_reprocesses_frames_without_id():
+    assistant, detector, audio = make_navigation(StaticCamera(object()))
+
+    assistant.process_frame()
+    assistant.process_frame()
+
+    assert detector.calls == 2
+    assert audio.messages == ["right", "right"]
+
+
+@pytest.mark.parametrize(
+    "bboxes, expected",
+    [
+        ([], "forward"),
+        ([(20, 0, 80, 60)], "right"),
+        ([(200, 0, 260, 80)], "left"),
+        ([(20, 0, 80, 60), (200, 0, 260, 80)], "forward"),
+        ([(20, 0, 80, 60), (30, 0, 90, 60), (200, 0, 260, 80)], "right"),
+        ([(99, 0, 220, 80)], "right"),
+        ([(100, 0, 220, 80)], "left"),
+    ],
+)
+@pytest.mark.parametrize("use_numba", [True, False], ids=["numba", "numpy"])
+def test_choose_direction_from_obstacles(bboxes, expected, use_numba, monkeypatch):
+    if use_numba and navigation.choose_direction_code is None:
+        pytest.skip("numba is not installed")
+    if not use_numba:
+        monkeypatch.setattr(navigation, "choose_direction_code", None)
+    obstacles = [Obstacle(bbox=bbox, label="x", confidence=1.0) for bbox in bboxes]
+
+    assert choose_direction_from_obstacles(obstacles, frame_width=320) == expected
+
+
+def test_choose_direction_rejects_non_positive_width():
+    with pytest.raises(ValueError):
+        choose_direction_from_obstacles([], frame_width=0)
+
+
+def test_obstacle_batch_round_trips_obstacles():
+    obstacles = [
+        Obstacle(bbox=(20, 0, 80, 60), label="chair", confidence=0.5),
+        Obstacle(bbox=(200, 0, 260, 80), label="door", confidence=0.25),
+    ]
+
+    batch = ObstacleBatch.from_obstacles(obstacles)
+
+    assert len(batch) == 2
+    assert batch.bboxes.shape == (2, 4)
+    assert batch.labels == ("chair", "door")
+    assert [tuple(obstacle.bbox) for obstacle in batch] == [(20, 0, 80, 60), (200, 0, 260, 80)]
+    assert [obstacle.confidence for obstacle in batch] == [0.5, 0.25]
+
+
+def test_dummy_detector_returns_batch_accepted_by_guidance():
+    detector = DummyObstacleDetector([Obstacle(bbox=(200, 0, 260, 80), label="door", confidence=0.9)])
+
+    batch = detector.detect(object())
+
+    assert isinstance(batch, ObstacleBatch)
+    assert choose_direction_from_obstacles(batch, frame_width=320) == "left"
+
+
+def test_dedup_audio_drops_repeats_within_window():
+    clock = FakeClock()
+    output = DummyAudioOutput()
+    audio = DedupAudio(output, dedup_window_s=1.0, clock=clock)
+
+    speak_at(audio, clock, "forward", 0.0)
+    speak_at(audio, clock, "forward", 0.5)
+    speak_at(audio, clock, "forward", 0.9)
+
+    assert output.messages == ["forward"]
+
+
+def test_dedup_audio_repeats_after_window_or_different_message():
+    clock = FakeClock()
+    output = DummyAudioOutput()
+    audio = DedupAudio(output, dedup_window_s=1.0, clock=clock)
+
+    speak_at(audio, clock, "forward", 0.0)
+    speak_at(audio, clock, "left", 0.1)
+    speak_at(audio, clock, "forward", 0.2)
+    speak_at(audio, clock, "forward", 1.3)
+
+    assert output.messages == ["forward", "left", "forward", "forward"]
+
+
+def test_dedup_audio_rejects_negative_window():
+    with pytest.raises(ValueError):
+        DedupAudio(DummyAudioOutput(), dedup_window_s=-1.0)
+
+
+def test_obstacle_bbox_is_stored_as_int32_array():
+    obstacle = Obstacle(bbox=[1, 2, 3, 4], label="chair", confidence=0.5)
+
+    assert obstacle.bbox.dtype == np.int32
+    assert obstacle.bbox.tolist() == [1, 2, 3, 4]
+
+
+def test_obstacle_rejects_bbox_without_four_values():
+    with pytest.raises(ValueError):
+        Obstacle(bbox=(1, 2, 3), label="chair", confidence=0.5)
+
+
+def test_batch_obstacles_view_the_bbox_matrix():
+    batch = ObstacleBatch.from_obstacles([Obstacle(bbox=(20, 0, 80, 60), label="chair", confidence=0.9)])
+
+    (obstacle,) = batch
+
+    assert np.shares_memory(obstacle.bbox, batch.bboxes)
+
+
+def test_frame_result_cache_matches_frames_on_id():
+    cache = FrameResultCache()
+    frame = Frame(id=1, payload=object())
+
+    assert cache.get(frame) is None
+    result = cache.put(frame, "forward")
+
+    assert cache.get(Frame(id=1, payload=object())) is result
+    assert cache.get(Frame(id=2, payload=object())) is None
+    cache.put(object(), "left")
+    assert cache.get(object()) is None
+
+
+def test_obstacle_batch_rejects_misshaped_bboxes():
+    with pytest.raises(ValueError):
+        ObstacleBatch(bboxes=np.arange(8).reshape(4, 2), labels=("a", "b"), confidences=[1, 1])
+    with pytest.raises(ValueError):
+        ObstacleBatch(bboxes=np.arange(4), labels=("a",), confidences=[1])
+
+
+def test_obstacle_batch_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        ObstacleBatch(bboxes=[[0, 0, 1, 1]], labels=("a", "b"), confidences=[1])
+
+
+def test_obstacle_batch_accepts_empty_input():
+    batch = ObstacleBatch.from_obstacles([])
+
+    assert batch.bboxes.shape == (0, 4)
+    assert len(batch) == 0
+    assert choose_direction_from_obstacles(batch, 320) == "forward"
+
+
+def test_obstacle_batch_is_read_only():
+    bboxes = np.array([[0, 0, 1, 1]])
+    batch = ObstacleBatch(bboxes=bboxes, labels=["a"], confidences=[1])
+
+    bboxes[0, 0] = 5
+    with pytest.raises(ValueError):
+        batch.bboxes[0, 0] = 5
+
+    assert batch.bboxes[0, 0] == 0
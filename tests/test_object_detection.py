@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from navigation import Frame
+from object_detection import DetectedObject, ObjectDetectionAssistant
+
+
+class StaticCamera:
+    def __init__(self, frame: object) -> None:
+        self.frame = frame
+
+    def get_frame(self) -> object:
+        return self.frame
+
+
+class RecordingAudio:
+    def __init__(self) -> None:
+        self.messages = []
+
+    def speak(self, message: str) -> None:
+        self.messages.append(message)
+
+
+class CountingObjectDetector:
+    def __init__(self, objects) -> None:
+        self.objects = list(objects)
+        self.calls = 0
+
+    def detect(self, frame: object):
+        self.calls += 1
+        return iter(self.objects)
+
+
+PERSON = DetectedObject(label="person", bbox=(0, 0, 10, 10), confidence=0.9)
+
+
+def make_assistant(camera):
+    detector = CountingObjectDetector([PERSON])
+    audio = RecordingAudio()
+    assistant = ObjectDetectionAssistant(camera=camera, detector=detector, audio=audio)
+    return assistant, detector, audio
+
+
+def test_default_result_omits_objects_and_announces_once():
+    assistant, detector, audio = make_assistant(StaticCamera(Frame(id=1, payload=object())))
+
+    first = assistant.process_frame()
+    second = assistant.process_frame()
+
+    assert first.objects is None
+    assert second is first
+    assert detector.calls == 1
+    assert audio.messages == ["person"]
+
+
+def test_include_objects_on_repeated_frame_does_not_speak_again():
+    assistant, detector, audio = make_assistant(StaticCamera(Frame(id=1, payload=object())))
+
+    assistant.process_frame()
+    result = assistant.process_frame(include_objects=True)
+
+    assert result.objects == [PERSON]
+    assert audio.messages == ["person"]
+
+
+def test_frames_without_id_are_always_processed():
+    assistant, detector, audio = make_assistant(StaticCamera(object()))
+
+    assistant.process_frame()
+    assistant.process_frame()
+
+    assert detector.calls == 2
+    assert audio.messages == ["person", "person"]
+
+
+def test_no_objects_is_announced():
+    audio = RecordingAudio()
+    assistant = ObjectDetectionAssistant(
+        camera=StaticCamera(object()), detector=CountingObjectDetector([]), audio=audio
+    )
+
+    assistant.process_frame()
+
+    assert audio.messages == ["no objects detected"]
+
+
+def test_detected_object_bbox_is_validated():
+    assert PERSON.bbox.dtype == np.int32
+    with pytest.raises(ValueError):
+        DetectedObject(label="person", bbox=(0, 0, 10), confidence=0.9)
+
+
+def test_frame_is_announced_as_one_utterance_without_duplicates():
+    book = DetectedObject(label="book", bbox=(20, 20, 40, 40), confidence=0.8)
+    audio = RecordingAudio()
+    assistant = ObjectDetectionAssistant(
+        camera=StaticCamera(object()),
+        detector=CountingObjectDetector([PERSON, book, PERSON]),
+        audio=audio,
+    )
+
+    assistant.process_frame()
+
+    assert audio.messages == ["person, book"]
@@ -0,0 +1,159 @@
+import numpy as np
+
+from navigation import Frame
+from reading_module import CachingOcrEngine, ReadingAssistant, frame_dhash
+
+
+class CountingOcrEngine:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def extract_text(self, frame: object) -> str:
+        self.calls += 1
+        return f"text{self.calls}"
+
+
+class StaticCamera:
+    def __init__(self, frame: object) -> None:
+        self.frame = frame
+
+    def get_frame(self) -> object:
+        return self.frame
+
+
+class RecordingAudio:
+    def __init__(self) -> None:
+        self.messages = []
+
+    def speak(self, message: str) -> None:
+        self.messages.append(message)
+
+
+def make_reading(camera):
+    engine = CountingOcrEngine()
+    audio = RecordingAudio()
+    return ReadingAssistant(camera=camera, ocr_engine=engine, audio=audio), engine, audio
+
+
+def blank_page() -> np.ndarray:
+    return np.full((120, 160), 255, dtype=np.uint8)
+
+
+def random_page(seed: int) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 256, size=(120, 160), dtype=np.uint8)
+
+
+def test_same_page_is_read_once():
+    engine = CountingOcrEngine()
+    ocr = CachingOcrEngine(engine)
+    page = random_page(0)
+
+    assert ocr.extract_text(Frame(id=0, payload=page)) == "text1"
+    assert ocr.extract_text(Frame(id=1, payload=page.copy())) == "text1"
+    assert engine.calls == 1
+
+
+def test_text_line_between_grid_rows_changes_the_key():
+    engine = CountingOcrEngine()
+    ocr = CachingOcrEngine(engine)
+    page_with_line = blank_page()
+    page_with_line[100:110, 20:140] = 0
+    page_with_full_width_line = blank_page()
+    page_with_full_width_line[100:110, :] = 0
+
+    texts = [
+        ocr.extract_text(page)
+        for page in (blank_page(), page_with_line, page_with_full_width_line)
+    ]
+
+    assert texts == ["text1", "text2", "text3"]
+
+
+def noisy_capture(page: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    noise = rng.normal(0, 8, size=page.shape)
+    return np.clip(page + noise, 0, 255).astype(np.uint8)
+
+
+def printed_page(line_rows) -> np.ndarray:
+    page = np.full((240, 320), 200.0)
+    for row in line_rows:
+        page[row : row + 8, 20:300] = 40
+    return page
+
+
+def test_noisy_captures_of_a_still_page_are_read_once():
+    rng = np.random.default_rng(0)
+    engine = CountingOcrEngine()
+    ocr = CachingOcrEngine(engine)
+    page = printed_page([30, 60, 90])
+
+    ocr.extract_text(Frame(id=0, payload=noisy_capture(page, rng)))
+    ocr.extract_text(Frame(id=1, payload=noisy_capture(page, rng)))
+
+    assert engine.calls == 1
+
+    ocr.extract_text(Frame(id=2, payload=noisy_capture(printed_page([30, 60, 90, 120]), rng)))
+
+    assert engine.calls == 2
+
+
+def test_hash_key_includes_frame_shape():
+    assert frame_dhash(np.zeros((40, 40))) != frame_dhash(np.zeros((40, 60)))
+
+
+def test_color_and_unhashable_frames():
+    assert frame_dhash(np.zeros((40, 40, 3), dtype=np.uint8)) is not None
+    assert frame_dhash(np.zeros((5, 5))) is None
+    assert frame_dhash(object()) is None
+
+
+def test_unhashable_frames_bypass_the_cache():
+    engine = CountingOcrEngine()
+    ocr = CachingOcrEngine(engine)
+
+    ocr.extract_text(object())
+    ocr.extract_text(object())
+
+    assert engine.calls == 2
+
+
+def test_cache_evicts_least_recently_used_page():
+    engine = CountingOcrEngine()
+    ocr = CachingOcrEngine(engine, maxsize=2)
+    pages = [random_page(seed) for seed in range(3)]
+
+    ocr.extract_text(pages[0])
+    ocr.extract_text(pages[1])
+    ocr.extract_text(pages[0])
+    ocr.extract_text(pages[2])
+
+    assert ocr.extract_text(pages[0]) == "text1"
+    assert ocr.extract_text(pages[1]) == "text4"
+
+
+def test_reading_reuses_result_for_repeated_frame():
+    camera = StaticCamera(Frame(id=3, payload=object()))
+    assistant, engine, audio = make_reading(camera)
+
+    first = assistant.process_frame()
+    second = assistant.process_frame()
+
+    assert second is first
+    assert first.text == "text1"
+    assert engine.calls == 1
+    assert audio.messages == ["text1"]
+
+    camera.frame = Frame(id=4, payload=object())
+    assistant.process_frame()
+
+    assert engine.calls == 2
+
+
+def test_reading_reprocesses_frames_without_id():
+    assistant, engine, audio = make_reading(StaticCamera(object()))
+
+    assistant.process_frame()
+    assistant.process_frame()
+
+    assert engine.calls == 2
+    assert audio.messages == ["text1", "text2"]
@@ -0,0 +1,125 @@
+import pytest
+
+from voice_assistance import CommandConfig, Transcriber, VoiceAssistant, _normalize
+
+
+class NullTranscriber(Transcriber):
+    def listen(self, audio_source: object) -> str:
+        return ""
+
+
+def make_assistant(config=None):
+    return VoiceAssistant(NullTranscriber(), command_config=config)
+
+
+@pytest.mark.parametrize(
+    "transcript, expected",
+    [
+        ("switch to navigation", "navigation"),
+        ("Switch  to Object Detection", "object_detection"),
+        ("please switch to reading now", "reading"),
+        ("read mode", "reading"),
+        ("hello there", None),
+    ],
+)
+def test_default_phrases(transcript, expected):
+    assert make_assistant().handle_transcript(transcript).matched_command == expected
+
+
+def test_unmatched_transcript_keeps_active_mode():
+    assistant = make_assistant()
+    assistant.handle_transcript("switch to reading")
+
+    result = assistant.handle_transcript("hello there")
+
+    assert result.matched_command is None
+    assert result.active_mode == "reading"
+
+
+def test_empty_config_matches_nothing():
+    config = CommandConfig(phrases_by_mode={})
+
+    assert make_assistant(config).handle_transcript("reading").matched_command is None
+
+
+def test_unsupported_mode_is_rejected():
+    with pytest.raises(ValueError):
+        CommandConfig(phrases_by_mode={"dancing": ("dance",)})
+
+
+def test_repeated_transcript_is_matched_from_cache():
+    assistant = make_assistant()
+
+    assistant.handle_transcript("switch to reading")
+    result = assistant.handle_transcript("switch to reading")
+
+    assert result.matched_command == "reading"
+    assert assistant._match_transcript.cache_info().hits == 1
+
+
+def test_longest_phrase_wins():
+    config = CommandConfig(
+        phrases_by_mode={
+            "reading": ("object",),
+            "object_detection": ("object detection",),
+        }
+    )
+
+    result = make_assistant(config).handle_transcript("start object detection")
+
+    assert result.matched_command == "object_detection"
+
+
+def test_phrases_are_normalized_and_empty_phrases_ignored():
+    config = CommandConfig(phrases_by_mode={"reading": ("  Read   This ", "   ")})
+    assistant = make_assistant(config)
+
+    assert assistant.handle_transcript("please read this").matched_command == "reading"
+    assert assistant.handle_transcript("hello there").matched_command is None
+
+
+def test_duplicate_phrase_keeps_first_mode():
+    config = CommandConfig(
+        phrases_by_mode={"navigation": ("go",), "reading": ("go",)}
+    )
+
+    assert make_assistant(config).handle_transcript("go").matched_command == "navigation"
+
+
+def test_pairs_are_deduplicated_longest_first():
+    config = CommandConfig(
+        phrases_by_mode={
+            "navigation": ("Go", "go ahead"),
+            "reading": ("go", "read"),
+        }
+    )
+
+    assert config._pairs == (("navigation", "go ahead"), ("reading", "read"), ("navigation", "go"))
+
+
+def test_exact_phrase_lookup_agrees_with_pattern_scan():
+    config = CommandConfig()
+    assistant = make_assistant(config)
+
+    for mode, phrase in config._pairs:
+        match = config._pattern.search(phrase)
+        assert config._pairs[match.lastindex - 1][0] == mode
+        assert assistant.handle_transcript(phrase).matched_command == mode
+
+
+def test_empty_transcript_keeps_active_mode_and_shares_result():
+    assistant = make_assistant()
+    assistant.handle_transcript("switch to reading")
+
+    first = assistant.listen_and_handle(audio_source=None)
+    second = assistant.handle_transcript("")
+
+    assert second is first
+    assert first.matched_command is None
+    assert first.active_mode == "reading"
+    assert assistant._match_transcript.cache_info().currsize == 1
+
+
+def test_normalize_lowercases_and_collapses_whitespace():
+    assert _normalize("  Switch\tTo\n  READING ") == "switch to reading"
+    assert _normalize("   ") == ""
@@ -7,14 +7,22 @@ reading modes.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Pattern, Tuple
 
 
 MODES = ("navigation", "object_detection", "reading")
 
 
-@dataclass(frozen=True)
+def _normalize(text: str) -> str:
+    """Lowercase ``text`` and collapse whitespace runs into single spaces."""
+
+    return " ".join(text.lower().split())
+
+
+@dataclass(frozen=True, slots=True)
 class CommandConfig:
     """Configuration for recognized command phrases."""
 
@@ -40,13 +48,42 @@ class CommandConfig:
         }
     )
 
+    _pairs: Tuple[Tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+    _exact_modes: Dict[str, str] = field(init=False, repr=False, compare=False)
+    _pattern: Optional[Pattern[str]] = field(init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         for mode in self.phrases_by_mode:
             if mode not in MODES:
                 raise ValueError(f"Unsupported mode: {mode}")
+        # Phrases are normalized like transcripts and ordered longest first,
+        # so "switch to object detection" wins over "object detection".
+        normalized = (
+            (mode, _normalize(phrase))
+            for mode, phrases in self.phrases_by_mode.items()
+            for phrase in phrases
+        )
+        mode_by_phrase: Dict[str, str] = {}
+        for mode, phrase in sorted(
+            ((mode, phrase) for mode, phrase in normalized if phrase),
+            key=lambda pair: len(pair[1]),
+            reverse=True,
+        ):
+            mode_by_phrase.setdefault(phrase, mode)
+        pairs = tuple((mode, phrase) for phrase, mode in mode_by_phrase.items())
+        # All phrases are compiled into one alternation so a transcript is
+        # scanned once; group i + 1 captures the phrase of pairs[i].
+        pattern = (
+            re.compile("|".join(f"({re.escape(phrase)})" for _, phrase in pairs))
+            if pairs
+            else None
+        )
+        object.__setattr__(self, "_pairs", pairs)
+        object.__setattr__(self, "_exact_modes", mode_by_phrase)
+        object.__setattr__(self, "_pattern", pattern)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModeSwitchResult:
     """Result of processing a transcript."""
 
@@ -76,6 +113,15 @@ class VoiceAssistant:
         self._transcriber = transcriber
         self._command_config = command_config or CommandConfig()
         self._active_mode = initial_mode
+        # Transcripts repeat often, so the normalize-and-match step is
+        # memoized per assistant; the size bound keeps memory flat.
+        self._match_transcript = lru_cache(maxsize=256)(self._normalize_and_match)
+        # Results are immutable, so the empty-transcript result for each mode
+        # is built once and shared.
+        self._noop_results = {
+            mode: ModeSwitchResult(transcript="", matched_command=None, active_mode=mode)
+            for mode in MODES
+        }
 
     @property
     def active_mode(self) -> str:
@@ -86,8 +132,9 @@ class VoiceAssistant:
         return self.handle_transcript(transcript)
 
     def handle_transcript(self, transcript: str) -> ModeSwitchResult:
-        normalized = " ".join(transcript.lower().split())
-        matched_mode = self._match_mode(normalized)
+        if not transcript:
+            return self._noop_results[self._active_mode]
+        matched_mode = self._match_transcript(transcript)
         if matched_mode:
             self._active_mode = matched_mode
         return ModeSwitchResult(
@@ -96,9 +143,20 @@ class VoiceAssistant:
             active_mode=self._active_mode,
         )
 
+    def _normalize_and_match(self, transcript: str) -> Optional[str]:
+        return self._match_mode(_normalize(transcript))
+
     def _match_mode(self, transcript: str) -> Optional[str]:
-        for mode, phrases in self._command_config.phrases_by_mode.items():
-            for phrase in phrases:
-                if phrase in transcript:
-                    return mode
-        return None
+        # A transcript that is exactly one phrase resolves by hash lookup; the
+        # scan below would return the same mode, since no longer phrase can
+        # match at position 0.
+        exact_mode = self._command_config._exact_modes.get(transcript)
+        if exact_mode is not None:
+            return exact_mode
+        pattern = self._command_config._pattern
+        if pattern is None:
+            return None
+        match = pattern.search(transcript)
+        if match is None or match.lastindex is None:
+            return None
+        return self._command_config._pairs[match.lastindex - 1][0]